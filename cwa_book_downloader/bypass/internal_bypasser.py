@@ -17,8 +17,7 @@ from seleniumbase import Driver
 from cwa_book_downloader.bypass import BypassCancelledException
 from cwa_book_downloader.bypass.fingerprint import clear_screen_size, get_screen_size
 from cwa_book_downloader.config import env
-from cwa_book_downloader.config.env import LOG_DIR
-from cwa_book_downloader.config.settings import RECORDING_DIR
+from cwa_book_downloader.config.env import LOG_DIR, RECORDING_DIR
 from cwa_book_downloader.core.config import config as app_config
 from cwa_book_downloader.core.logger import setup_logger
 from cwa_book_downloader.download import network
@@ -3,7 +3,9 @@
 import json
 import os
 import shutil
+import time
 from pathlib import Path
+from typing import Optional, Tuple
 
 
 def string_to_bool(s: str) -> bool:
@@ -72,11 +74,29 @@ def _is_config_dir_writable() -> bool:
         return False
 
 
+# The writability probe creates and deletes a file, too costly to repeat for every
+# cover URL in a result list, so its result is reused for a short while.
+_CONFIG_DIR_WRITABLE_RECHECK_SECONDS = 60.0
+_config_dir_writable_checked: Optional[Tuple[float, bool]] = None
+
+
+def _is_config_dir_writable_cached() -> bool:
+    """Return _is_config_dir_writable(), re-probing at most once per recheck interval."""
+    global _config_dir_writable_checked
+    now = time.monotonic()
+    if (
+        _config_dir_writable_checked is None
+        or now - _config_dir_writable_checked[0] > _CONFIG_DIR_WRITABLE_RECHECK_SECONDS
+    ):
+        _config_dir_writable_checked = (now, _is_config_dir_writable())
+    return _config_dir_writable_checked[1]
+
+
 def is_covers_cache_enabled() -> bool:
     """Check if cover caching is enabled (requires setting + writable config dir)."""
     from cwa_book_downloader.core.config import config
     setting_enabled = config.get("COVERS_CACHE_ENABLED", True)
-    return setting_enabled and _is_config_dir_writable()
+    return setting_enabled and _is_config_dir_writable_cached()
 
 
 # =============================================================================
@@ -87,6 +107,7 @@ CONFIG_DIR = Path(os.getenv("CONFIG_DIR", "/config"))
 LOG_ROOT = Path(os.getenv("LOG_ROOT", "/var/log/"))
 LOG_DIR = LOG_ROOT / "cwa-book-downloader"
 LOG_FILE = LOG_DIR / "cwa-book-downloader.log"
+RECORDING_DIR = LOG_DIR / "recording"  # Screen recordings from the internal bypasser (debug only)
 TMP_DIR = Path(os.getenv("TMP_DIR", "/tmp/cwa-book-downloader"))
 INGEST_DIR = Path(os.getenv("INGEST_DIR", "/books"))
 
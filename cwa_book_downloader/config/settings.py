@@ -1,6 +1,6 @@
 """Core settings registration and derived configuration values."""
 
-import os
+import logging
 from pathlib import Path
 import json
 
@@ -9,11 +9,14 @@ from cwa_book_downloader.core.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Bootstrap values logged at startup - all are defined by env and none are sensitive
+_BOOTSTRAP_LOG_KEYS = ("CONFIG_DIR", "LOG_DIR", "TMP_DIR", "INGEST_DIR", "DEBUG", "DOCKERMODE")
+
 # Log bootstrap configuration values at DEBUG level
-logger.debug("Bootstrap configuration:")
-for key in ['CONFIG_DIR', 'LOG_DIR', 'TMP_DIR', 'INGEST_DIR', 'DEBUG', 'DOCKERMODE']:
-    if hasattr(env, key):
-        logger.debug(f"  {key}: {getattr(env, key)}")
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug("Bootstrap configuration:")
+    for key in _BOOTSTRAP_LOG_KEYS:
+        logger.debug("  %s: %s", key, getattr(env, key))
 
 # Load supported book languages from data file
 # Path is relative to the package root, not this file
@@ -23,26 +26,18 @@ with open(_DATA_DIR / "book-languages.json") as file:
 
 # Directory settings
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
-logger.debug(f"BASE_DIR: {BASE_DIR}")
-if env.ENABLE_LOGGING:
-    env.LOG_DIR.mkdir(exist_ok=True)
-
-# Create necessary directories
-env.TMP_DIR.mkdir(exist_ok=True)
-env.INGEST_DIR.mkdir(exist_ok=True)
+logger.debug("BASE_DIR: %s", BASE_DIR)
 
-CROSS_FILE_SYSTEM = os.stat(env.TMP_DIR).st_dev != os.stat(env.INGEST_DIR).st_dev
-logger.debug(f"STAT TMP_DIR: {os.stat(env.TMP_DIR)}")
-logger.debug(f"STAT INGEST_DIR: {os.stat(env.INGEST_DIR)}")
-logger.debug(f"CROSS_FILE_SYSTEM: {CROSS_FILE_SYSTEM}")
+# Directories are created on first write rather than at import:
+# - LOG_DIR by setup_logger() when the file handler is attached
+# - TMP_DIR by orchestrator.get_staging_dir()
+# - Destination folders by the orchestrator before moving files in
+# Cross-filesystem checks happen per transfer via naming.same_filesystem().
 
 # DNS placeholders - actual values set by network.init() from config/ENV
 CUSTOM_DNS: list[str] = []
 DOH_SERVER: str = ""
 
-# Recording directory for debugging internal cloudflare bypasser
-RECORDING_DIR = env.LOG_DIR / "recording"
-
 
 def _log_external_bypasser_warning() -> None:
     """Log warning about external bypasser DNS limitations (called after config is available)."""
@@ -121,6 +116,54 @@ _AUDIOBOOK_FORMAT_OPTIONS = [
     {"value": "rar", "label": "RAR"},
 ]
 
+_SEARCH_MODE_OPTIONS = [
+    {
+        "value": "direct",
+        "label": "Direct (Anna's Archive)",
+        "description": "Search Anna's Archive and download directly. Works out of the box.",
+    },
+    {
+        "value": "universal",
+        "label": "Universal",
+        "description": "Metadata-based search with downloads from all sources. Book and Audiobook support.",
+    },
+]
+
+_DNS_OPTIONS = [
+    {"value": "auto", "label": "Auto (Recommended)"},
+    {"value": "system", "label": "System"},
+    {"value": "google", "label": "Google"},
+    {"value": "cloudflare", "label": "Cloudflare"},
+    {"value": "quad9", "label": "Quad9"},
+    {"value": "opendns", "label": "OpenDNS"},
+    {"value": "manual", "label": "Manual"},
+]
+
+_PROXY_MODE_OPTIONS = [
+    {"value": "none", "label": "None (Direct Connection)"},
+    {"value": "http", "label": "HTTP/HTTPS Proxy"},
+    {"value": "socks5", "label": "SOCKS5 Proxy"},
+]
+
+_FILE_ORGANIZATION_OPTIONS = [
+    {"value": "none", "label": "None", "description": "Keep original filename from source"},
+    {"value": "rename", "label": "Rename", "description": "Rename files using a template"},
+    {"value": "organize", "label": "Organize", "description": "Create folders and rename files using a template. Do not use with ingest folders."},
+]
+
+_FILE_ORGANIZATION_AUDIOBOOK_OPTIONS = [
+    {"value": "none", "label": "None", "description": "Keep original filename from source"},
+    {"value": "rename", "label": "Rename", "description": "Rename files using a template"},
+    {"value": "organize", "label": "Organize", "description": "Create folders and rename files using a template. Recommended for Audiobookshelf. Do not use with ingest folders."},
+]
+
+_AA_URL_OPTIONS = [
+    {"value": "auto", "label": "Auto (Recommended)"},
+    {"value": "https://annas-archive.org", "label": "annas-archive.org"},
+    {"value": "https://annas-archive.se", "label": "annas-archive.se"},
+    {"value": "https://annas-archive.li", "label": "annas-archive.li"},
+]
+
 
 def _get_metadata_provider_options():
     """Build metadata provider options dynamically from enabled providers only."""
@@ -254,18 +297,7 @@ def search_mode_settings():
             key="SEARCH_MODE",
             label="Search Mode",
             description="How you want to search for and download books.",
-            options=[
-                {
-                    "value": "direct",
-                    "label": "Direct (Anna's Archive)",
-                    "description": "Search Anna's Archive and download directly. Works out of the box.",
-                },
-                {
-                    "value": "universal",
-                    "label": "Universal",
-                    "description": "Metadata-based search with downloads from all sources. Book and Audiobook support.",
-                },
-            ],
+            options=_SEARCH_MODE_OPTIONS,
             default="direct",
         ),
         SelectField(
@@ -331,15 +363,7 @@ def network_settings():
                 if tor_overrides_network
                 else "DNS provider for domain resolution. 'Auto' rotates through providers on failure."
             ),
-            options=[
-                {"value": "auto", "label": "Auto (Recommended)"},
-                {"value": "system", "label": "System"},
-                {"value": "google", "label": "Google"},
-                {"value": "cloudflare", "label": "Cloudflare"},
-                {"value": "quad9", "label": "Quad9"},
-                {"value": "opendns", "label": "OpenDNS"},
-                {"value": "manual", "label": "Manual"},
-            ],
+            options=_DNS_OPTIONS,
             default="auto",
             disabled=tor_overrides_network,
             disabled_reason="DNS is managed by Tor when Tor routing is enabled.",
@@ -397,11 +421,7 @@ def network_settings():
                 if tor_overrides_network
                 else "Choose proxy type. SOCKS5 handles all traffic through a single proxy."
             ),
-            options=[
-                {"value": "none", "label": "None (Direct Connection)"},
-                {"value": "http", "label": "HTTP/HTTPS Proxy"},
-                {"value": "socks5", "label": "SOCKS5 Proxy"},
-            ],
+            options=_PROXY_MODE_OPTIONS,
             default="none",
             disabled=tor_overrides_network,
             disabled_reason="Proxy settings are not used when Tor routing is enabled.",
@@ -458,23 +478,7 @@ def download_settings():
             key="FILE_ORGANIZATION",
             label="File Organization",
             description="Choose how downloaded book files are named and organized. ",
-            options=[
-                {
-                    "value": "none",
-                    "label": "None",
-                    "description": "Keep original filename from source"
-                },
-                {
-                    "value": "rename",
-                    "label": "Rename",
-                    "description": "Rename files using a template"
-                },
-                {
-                    "value": "organize",
-                    "label": "Organize",
-                    "description": "Create folders and rename files using a template. Do not use with ingest folders."
-                },
-            ],
+            options=_FILE_ORGANIZATION_OPTIONS,
             default="rename",
         ),
         # Rename mode template - filename only
@@ -522,11 +526,7 @@ def download_settings():
             key="FILE_ORGANIZATION_AUDIOBOOK",
             label="File Organization",
             description="Choose how downloaded audiobook files are named and organized.",
-            options=[
-                {"value": "none", "label": "None", "description": "Keep original filename from source"},
-                {"value": "rename", "label": "Rename", "description": "Rename files using a template"},
-                {"value": "organize", "label": "Organize", "description": "Create folders and rename files using a template. Recommended for Audiobookshelf. Do not use with ingest folders."},
-            ],
+            options=_FILE_ORGANIZATION_AUDIOBOOK_OPTIONS,
             default="rename",
             universal_only=True,
         ),
@@ -715,12 +715,7 @@ def download_source_settings():
             key="AA_BASE_URL",
             label="Anna's Archive URL",
             description="Primary Anna's Archive mirror to use. 'auto' selects automatically.",
-            options=[
-                {"value": "auto", "label": "Auto (Recommended)"},
-                {"value": "https://annas-archive.org", "label": "annas-archive.org"},
-                {"value": "https://annas-archive.se", "label": "annas-archive.se"},
-                {"value": "https://annas-archive.li", "label": "annas-archive.li"},
-            ],
+            options=_AA_URL_OPTIONS,
             default="auto",
         ),
         TextField(
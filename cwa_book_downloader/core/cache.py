@@ -1,11 +1,13 @@
 """Thread-safe in-memory cache with TTL support."""
 
+import heapq
+import inspect
 import threading
 import time
-from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
 
+from cwa_book_downloader.core.config import config
 from cwa_book_downloader.core.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -13,48 +15,47 @@ logger = setup_logger(__name__)
 T = TypeVar("T")
 
 
-@dataclass
-class CacheEntry:
-    """A cached value with expiration time."""
-    value: Any
-    expires_at: float
-
-
 class CacheService:
     """Thread-safe in-memory cache with TTL support."""
 
     def __init__(self, max_size: int = 1000):
         """Initialize cache with max_size entries before eviction."""
-        self._cache: Dict[str, CacheEntry] = {}
+        # Entries are (expires_at, value) tuples - smaller than an object per entry.
+        # Expiry uses the monotonic clock so wall-clock jumps don't affect TTLs.
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
         self._lock = threading.Lock()
         self._max_size = max_size
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """Get cached value if not expired."""
-        with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                return None
+        # Reads don't take the lock - dict.get is atomic and entries are
+        # replaced wholesale, so a hit never sees a half-written entry
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
 
-            if time.time() > entry.expires_at:
-                del self._cache[key]
-                return None
+        expires_at, value = entry
+        if time.monotonic() <= expires_at:
+            return value
 
-            return entry.value
+        # Expired: remove it, unless set() has replaced it in the meantime
+        with self._lock:
+            if self._cache.get(key) is entry:
+                del self._cache[key]
+        return None
 
-    def set(self, key: str, value: Any, ttl: int) -> None:
+    def set(self, key: Hashable, value: Any, ttl: int) -> None:
         """Cache value with TTL in seconds."""
+        # Build the entry before taking the lock to keep the critical section short
+        entry = (time.monotonic() + ttl, value)
         with self._lock:
             # Evict oldest entries if at capacity
             if len(self._cache) >= self._max_size:
                 self._evict_oldest()
 
-            self._cache[key] = CacheEntry(
-                value=value,
-                expires_at=time.time() + ttl
-            )
+            self._cache[key] = entry
 
-    def invalidate(self, key: str) -> bool:
+    def invalidate(self, key: Hashable) -> bool:
         """Remove specific cache entry. Returns True if found."""
         with self._lock:
             if key in self._cache:
@@ -70,28 +71,45 @@ class CacheService:
     def cleanup_expired(self) -> int:
         """Remove all expired entries. Returns count removed."""
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
+            cache = self._cache
             expired_keys = [
-                key for key, entry in self._cache.items()
-                if entry.expires_at < now
+                key for key, (expires_at, _) in cache.items()
+                if expires_at < now
             ]
             for key in expired_keys:
-                del self._cache[key]
+                del cache[key]
             return len(expired_keys)
 
     def _evict_oldest(self) -> None:
-        """Evict ~10% of oldest entries. Called with lock held."""
+        """Evict expired entries, then oldest entries up to ~10%. Called with lock held."""
         if not self._cache:
             return
 
-        # Remove ~10% of entries, oldest first
         entries_to_remove = max(1, len(self._cache) // 10)
-        sorted_entries = sorted(
+
+        # Expired entries are only dropped lazily on read, so sweep them all here
+        now = time.monotonic()
+        expired_keys = [
+            key for key, (expires_at, _) in self._cache.items()
+            if expires_at < now
+        ]
+        for key in expired_keys:
+            del self._cache[key]
+
+        entries_to_remove -= len(expired_keys)
+        if entries_to_remove <= 0:
+            return
+
+        # Remove the rest, oldest first. nsmallest only keeps the k victims
+        # in a heap rather than sorting the whole cache.
+        oldest_entries = heapq.nsmallest(
+            entries_to_remove,
             self._cache.items(),
-            key=lambda x: x[1].expires_at
+            key=lambda x: x[1][0]
         )
 
-        for key, _ in sorted_entries[:entries_to_remove]:
+        for key, _ in oldest_entries:
             del self._cache[key]
 
     def stats(self) -> Dict[str, int]:
@@ -112,11 +130,26 @@ def get_metadata_cache() -> CacheService:
     return _metadata_cache
 
 
-def cache_key(*args, **kwargs) -> str:
+
+def _hashable(value: Any) -> Hashable:
+    """Return (type, value) if hashable, else (type, string form) (e.g. dataclass options).
+
+    The type is part of the key so equal-comparing values such as 1, 1.0 and True
+    don't share a cache entry.
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return type(value), str(value)
+    return type(value), value
+
+
+def cache_key(*args, **kwargs) -> Tuple[Hashable, ...]:
     """Generate cache key from arguments."""
-    parts = [str(arg) for arg in args]
-    parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-    return ":".join(parts)
+    key = tuple(_hashable(arg) for arg in args)
+    if kwargs:
+        key += tuple((k, _hashable(v)) for k, v in sorted(kwargs.items()))
+    return key
 
 
 def cacheable(
@@ -127,11 +160,13 @@ def cacheable(
 ):
     """Decorator for caching function results. Use ttl (static) or ttl_key (from config)."""
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # Skip 'self' in cache keys when decorating a method (decided once here)
+        params = list(inspect.signature(func).parameters)
+        skip_self = bool(params) and params[0] == "self"
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
             # Check if metadata caching is enabled
-            from cwa_book_downloader.core.config import config
-
             if not config.get("METADATA_CACHE_ENABLED", True):
                 # Caching disabled, execute function directly
                 return func(*args, **kwargs)
@@ -145,8 +180,7 @@ def cacheable(
                 effective_ttl = ttl_default
 
             # Generate cache key from function name and arguments
-            # Skip 'self' argument if present (first arg of method)
-            cache_args = args[1:] if args and hasattr(args[0], func.__name__) else args
+            cache_args = args[1:] if skip_self else args
 
             key = cache_key(
                 key_prefix or func.__name__,
@@ -162,7 +196,7 @@ def cacheable(
             # Execute function and cache result
             result = func(*args, **kwargs)
 
-            # Only cache non-None results
+            # Don't cache None - providers also return None on errors, so it must be retried
             if result is not None:
                 _metadata_cache.set(key, result, effective_ttl)
 
@@ -2,8 +2,9 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 from cwa_book_downloader.core.logger import setup_logger
 
@@ -16,8 +17,13 @@ TOKEN_PATTERN = re.compile(
     r'([- ._/\])]*)\}'    # suffix: space, dash, dot, underscore, slash, brackets
 )
 
-# Characters that are invalid in filenames on various filesystems
-INVALID_CHARS = re.compile(r'[\\:*?"<>|]')
+# Characters that are invalid in filenames on various filesystems, mapped to '_'.
+# str.translate does the replacement in a single C-level pass.
+INVALID_CHARS_TABLE = str.maketrans(dict.fromkeys('\\:*?"<>|', '_'))
+EDGE_WHITESPACE_DOTS_PATTERN = re.compile(r'^[\s.]+|[\s.]+$')
+UNDERSCORE_RUN_PATTERN = re.compile(r'_{2,}')
+# Matches anything the passes below would change; most names don't need them
+NEEDS_SANITIZING_PATTERN = re.compile(r'[\\:*?"<>|]|__|^[\s.]|[\s.]\Z')
 
 
 def _sanitize(name: str, max_length: int = 245) -> str:
@@ -25,9 +31,12 @@ def _sanitize(name: str, max_length: int = 245) -> str:
     if not name:
         return ""
 
-    sanitized = INVALID_CHARS.sub('_', name)
-    sanitized = re.sub(r'^[\s.]+|[\s.]+$', '', sanitized)  # Strip whitespace and dots
-    sanitized = re.sub(r'_+', '_', sanitized)  # Collapse underscores
+    if not NEEDS_SANITIZING_PATTERN.search(name):
+        return name[:max_length]
+
+    sanitized = name.translate(INVALID_CHARS_TABLE)
+    sanitized = EDGE_WHITESPACE_DOTS_PATTERN.sub('', sanitized)  # Strip whitespace and dots
+    sanitized = UNDERSCORE_RUN_PATTERN.sub('_', sanitized)  # Collapse underscores
     return sanitized[:max_length]
 
 
@@ -76,6 +85,15 @@ def assign_part_numbers(
     ]
 
 
+# Cleanup passes applied after token substitution
+DUPLICATE_SLASHES_PATTERN = re.compile(r'/+')
+LEADING_SEPARATORS_PATTERN = re.compile(r'^[\s\-_.]+')
+TRAILING_SEPARATORS_PATTERN = re.compile(r'[\s\-_.]+$')
+REPEATED_DASHES_PATTERN = re.compile(r'(\s*-\s*){2,}')
+EMPTY_PARENS_PATTERN = re.compile(r'\(\s*\)')
+EMPTY_BRACKETS_PATTERN = re.compile(r'\[\s*\]')
+
+
 def parse_naming_template(
     template: str,
     metadata: Dict[str, Optional[Union[str, int, float]]],
@@ -83,13 +101,46 @@ def parse_naming_template(
     if not template:
         return ""
 
-    # Normalize metadata keys to lowercase for case-insensitive matching
-    normalized = {k.lower(): v for k, v in metadata.items()}
+    # Normalize metadata keys to lowercase for case-insensitive matching.
+    # Metadata values are scalars, so the sorted items form a hashable cache key.
+    normalized = {k.lower(): v for k, v in metadata.items() if v is not None}
+    return _parse_naming_template_cached(template, tuple(sorted(normalized.items())))
+
+
+# A compiled template is a sequence of literal strings and
+# (prefix, lowercase token name, suffix) tuples.
+TemplateSegment = Union[str, Tuple[str, str, str]]
 
-    def replace_token(match: re.Match) -> str:
-        prefix = match.group(1)
-        token_name = match.group(2).lower()
-        suffix = match.group(3)
+
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> Tuple[TemplateSegment, ...]:
+    """Split a template into literals and token descriptors once."""
+    segments: list[TemplateSegment] = []
+    pos = 0
+    for match in TOKEN_PATTERN.finditer(template):
+        if match.start() > pos:
+            segments.append(template[pos:match.start()])
+        segments.append((match.group(1), match.group(2).lower(), match.group(3)))
+        pos = match.end()
+    if pos < len(template):
+        segments.append(template[pos:])
+    return tuple(segments)
+
+
+@lru_cache(maxsize=4096)
+def _parse_naming_template_cached(
+    template: str,
+    meta_items: Tuple[Tuple[str, Union[str, int, float]], ...],
+) -> str:
+    normalized = dict(meta_items)
+
+    parts = []
+    for segment in _compile_template(template):
+        if isinstance(segment, str):
+            parts.append(segment)
+            continue
+
+        prefix, token_name, suffix = segment
 
         # Get the value for this token
         value = normalized.get(token_name)
@@ -99,40 +150,35 @@ def parse_naming_template(
             value = format_series_position(value)
 
         # Convert to string
-        if value is None:
-            value = ""
-        else:
-            value = str(value).strip()
+        value = "" if value is None else str(value).strip()
 
-        # If value is empty, return empty string (no prefix/suffix)
+        # If value is empty, drop the token along with its prefix/suffix
         if not value:
-            return ""
-
-        # Sanitize the value
-        value = sanitize_filename(value)
+            continue
 
-        return f"{prefix}{value}{suffix}"
+        parts.append(prefix)
+        parts.append(sanitize_filename(value))
+        parts.append(suffix)
 
-    # Replace all tokens
-    result = TOKEN_PATTERN.sub(replace_token, template)
+    result = "".join(parts)
 
     # Clean up any double slashes that might result from empty tokens
-    result = re.sub(r'/+', '/', result)
+    result = DUPLICATE_SLASHES_PATTERN.sub('/', result)
 
     # Remove leading/trailing slashes
     result = result.strip('/')
 
     # Clean up any orphaned separators (e.g., " - " at start/end, or " -  - ")
-    result = re.sub(r'^[\s\-_.]+', '', result)
-    result = re.sub(r'[\s\-_.]+$', '', result)
-    result = re.sub(r'(\s*-\s*){2,}', ' - ', result)
+    result = LEADING_SEPARATORS_PATTERN.sub('', result)
+    result = TRAILING_SEPARATORS_PATTERN.sub('', result)
+    result = REPEATED_DASHES_PATTERN.sub(' - ', result)
 
     # Clean up empty parentheses/brackets
-    result = re.sub(r'\(\s*\)', '', result)
-    result = re.sub(r'\[\s*\]', '', result)
+    result = EMPTY_PARENS_PATTERN.sub('', result)
+    result = EMPTY_BRACKETS_PATTERN.sub('', result)
 
     # Final trim of any trailing separators left after cleanup
-    result = re.sub(r'[\s\-_.]+$', '', result)
+    result = TRAILING_SEPARATORS_PATTERN.sub('', result)
 
     return result
 
@@ -153,22 +199,27 @@ def build_library_path(
     # Remove any path traversal attempts
     relative = relative.replace('..', '')
 
-    base = Path(base_path).resolve()
-    full_path = (base / relative).resolve()
+    # The library root is resolved once and cached. The joined path is still resolved
+    # so a symlinked subdirectory can't point outside the library.
+    base = _resolved_base(str(base_path))
+    full_path = os.path.realpath(os.path.join(base, relative))
 
     # Verify the path is within the base directory
-    try:
-        full_path.relative_to(base)
-    except ValueError:
+    if os.path.commonpath([base, full_path]) != base:
         raise ValueError(f"Path traversal detected: template would escape library directory")
 
     if extension:
         ext = extension.lstrip('.')
         # Don't use with_suffix() - it replaces everything after the first dot
         # e.g., "2.5 - Title" would become "2.epub" instead of "2.5 - Title.epub"
-        full_path = Path(f"{full_path}.{ext}")
+        full_path = f"{full_path}.{ext}"
 
-    return full_path
+    return Path(full_path)
+
+
+@lru_cache(maxsize=8)
+def _resolved_base(base_path: str) -> str:
+    return os.path.realpath(base_path)
 
 
 def same_filesystem(path1: Union[str, Path], path2: Union[str, Path]) -> bool:
@@ -177,15 +228,18 @@ def same_filesystem(path1: Union[str, Path], path2: Union[str, Path]) -> bool:
     path2 = Path(path2)
 
     def get_device(p: Path) -> Optional[int]:
-        try:
-            while not p.exists():
-                p = p.parent
+        # Walk up to the nearest existing ancestor, one stat() per level
+        while True:
+            try:
+                return os.stat(p).st_dev
+            except (FileNotFoundError, NotADirectoryError) as e:
                 if p == p.parent:
-                    break
-            return os.stat(p).st_dev
-        except (OSError, PermissionError) as e:
-            logger.debug(f"Cannot stat {p}: {e}")
-            return None
+                    logger.debug(f"Cannot stat {p}: {e}")
+                    return None
+                p = p.parent
+            except OSError as e:
+                logger.debug(f"Cannot stat {p}: {e}")
+                return None
 
     dev1 = get_device(path1)
     dev2 = get_device(path2)
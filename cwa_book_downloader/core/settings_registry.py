@@ -8,11 +8,13 @@ from typing import Any, Callable, Dict, List, Optional, Type, Union
 from threading import Lock
 
 from cwa_book_downloader.core.logger import setup_logger
+from cwa_book_downloader.core.utils import split_csv
 
 logger = setup_logger(__name__)
 
 
-@dataclass
+# Field definitions are immutable once built; slots keep the per-field footprint small
+@dataclass(frozen=True, slots=True)
 class FieldBase:
     """Base class for all settings fields."""
     key: str                              # Environment variable / config key
@@ -38,20 +40,20 @@ class FieldBase:
         return self.__class__.__name__
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TextField(FieldBase):
     """Single-line text input."""
     placeholder: str = ""
     max_length: Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PasswordField(FieldBase):
     """Password input (masked in UI, not returned in API responses)."""
     placeholder: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NumberField(FieldBase):
     """Numeric input."""
     min_value: Optional[float] = None
@@ -60,20 +62,20 @@ class NumberField(FieldBase):
     default: float = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CheckboxField(FieldBase):
     """Boolean checkbox."""
     default: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SelectField(FieldBase):
     """Single-choice dropdown."""
     # Options can be a list or a callable that returns a list (for lazy evaluation)
     options: Any = field(default_factory=list)  # [{value: "", label: ""}] or callable
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MultiSelectField(FieldBase):
     """Multiple-choice selection."""
     # Options can be a list or a callable that returns a list (for lazy evaluation)
@@ -82,7 +84,7 @@ class MultiSelectField(FieldBase):
     variant: str = "pills"  # "pills" (default) or "dropdown" for checkbox dropdown style
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrderableListField(FieldBase):
     # Options can be a list or a callable that returns a list (for lazy evaluation)
     # Each option: {id, label, description?, disabledReason?, isLocked?}
@@ -91,7 +93,7 @@ class OrderableListField(FieldBase):
     default: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionButton:
     key: str                              # Action identifier
     label: str                            # Button text
@@ -107,7 +109,7 @@ class ActionButton:
         return "ActionButton"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HeadingField:
     """
     Display-only heading with title and description.
@@ -171,7 +173,7 @@ def register_group(
             order=order,
         )
         _GROUPS_REGISTRY[name] = group
-        logger.debug(f"Registered settings group: {name}")
+        logger.debug("Registered settings group: %s", name)
 
 
 def register_settings(
@@ -193,8 +195,8 @@ def register_settings(
                 group=group,
             )
             _SETTINGS_REGISTRY[name] = tab
-            logger.debug(f"Registered settings tab: {name} ({len(fields)} fields)" +
-                        (f" in group {group}" if group else ""))
+            logger.debug("Registered settings tab: %s (%d fields)%s", name, len(fields),
+                         " in group " + group if group else "")
         return func
     return decorator
 
@@ -205,7 +207,7 @@ def register_on_save(
 ) -> None:
     with _REGISTRY_LOCK:
         _ON_SAVE_HANDLERS[tab_name] = handler
-        logger.debug(f"Registered on_save handler for tab: {tab_name}")
+        logger.debug("Registered on_save handler for tab: %s", tab_name)
 
 
 def get_on_save_handler(tab_name: str) -> Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]:
@@ -307,7 +309,7 @@ def sync_env_to_config() -> None:
         # Save synced values to config file (merge with existing)
         if values_to_sync:
             save_config_file(tab.name, values_to_sync)
-            logger.debug(f"Synced {len(values_to_sync)} ENV values to {tab.name} config: {list(values_to_sync.keys())}")
+            logger.debug("Synced %d ENV values to %s config: %s", len(values_to_sync), tab.name, list(values_to_sync))
 
     # Migrate legacy settings to new format
     migrate_legacy_settings()
@@ -444,7 +446,7 @@ def _parse_env_value(value: str, field: SettingsField) -> Any:
         except ValueError:
             return field.default
     elif isinstance(field, MultiSelectField):
-        return [v.strip() for v in value.split(',') if v.strip()]
+        return split_csv(value)
     elif isinstance(field, OrderableListField):
         # Parse JSON array: [{"id": "...", "enabled": true}, ...]
         try:
@@ -657,7 +659,7 @@ def _apply_dns_settings(config) -> None:
             manual_dns = config.get("CUSTOM_DNS_MANUAL", "")
             if manual_dns:
                 # Parse comma-separated server list
-                manual_servers = [s.strip() for s in manual_dns.split(",") if s.strip()]
+                manual_servers = split_csv(manual_dns)
 
         network.set_dns_provider(provider, manual_servers, use_doh=use_doh)
     except ImportError:
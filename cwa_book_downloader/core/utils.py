@@ -1,8 +1,16 @@
 """Shared utility functions for the CWA Book Downloader."""
 
 import base64
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+from cwa_book_downloader.config.env import is_covers_cache_enabled
+
+
+def split_csv(value: str) -> List[str]:
+    """Split a comma-separated string into stripped, non-empty items."""
+    return [item for item in map(str.strip, value.split(",")) if item]
 
 
 def is_audiobook(content_type: Optional[str]) -> bool:
@@ -49,6 +57,12 @@ _LEGACY_CONTENT_TYPE_TO_CONFIG_KEY = {
     "other": "INGEST_DIR_OTHER",
 }
 
+# Config keys to check per content type: new AA-specific key first, then legacy key
+_CONTENT_TYPE_CONFIG_KEYS = {
+    content_type: (config_key, _LEGACY_CONTENT_TYPE_TO_CONFIG_KEY[content_type])
+    for content_type, config_key in _AA_CONTENT_TYPE_TO_CONFIG_KEY.items()
+}
+
 
 def get_destination(is_audiobook: bool = False) -> Path:
     """Get base destination directory. Audiobooks fall back to main destination."""
@@ -68,24 +82,23 @@ def get_destination(is_audiobook: bool = False) -> Path:
 
 def get_aa_content_type_dir(content_type: Optional[str] = None) -> Optional[Path]:
     """Get override directory for AA content-type routing if configured."""
+    if not content_type:
+        return None
+
+    config_keys = _CONTENT_TYPE_CONFIG_KEYS.get(content_type.lower().strip())
+    if not config_keys:
+        return None
+
     from cwa_book_downloader.core.config import config
 
     # Check if content-type routing is enabled (new or legacy setting)
     if not config.get("AA_CONTENT_TYPE_ROUTING", False) and not config.get("USE_CONTENT_TYPE_DIRECTORIES", False):
         return None
 
-    if not content_type:
-        return None
-
-    content_type_lower = content_type.lower().strip()
-
-    # Try new AA-specific config keys first, then legacy keys
-    for mapping in (_AA_CONTENT_TYPE_TO_CONFIG_KEY, _LEGACY_CONTENT_TYPE_TO_CONFIG_KEY):
-        config_key = mapping.get(content_type_lower)
-        if config_key:
-            custom_dir = config.get(config_key, "")
-            if custom_dir:
-                return Path(custom_dir)
+    for config_key in config_keys:
+        custom_dir = config.get(config_key, "")
+        if custom_dir:
+            return Path(custom_dir)
 
     return None
 
@@ -118,10 +131,14 @@ def transform_cover_url(cover_url: Optional[str], cache_id: str) -> Optional[str
         return cover_url
 
     # Check if cover caching is enabled
-    from cwa_book_downloader.config.env import is_covers_cache_enabled
     if not is_covers_cache_enabled():
         return cover_url
 
     # Encode the original URL and create a proxy URL
-    encoded_url = base64.urlsafe_b64encode(cover_url.encode()).decode()
-    return f"/api/covers/{cache_id}?url={encoded_url}"
+    return f"/api/covers/{cache_id}?url={_encode_cover_url(cover_url)}"
+
+
+@lru_cache(maxsize=8192)
+def _encode_cover_url(cover_url: str) -> str:
+    """Base64-encode a cover URL; the same covers are rendered repeatedly."""
+    return base64.urlsafe_b64encode(cover_url.encode()).decode()
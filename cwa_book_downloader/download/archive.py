@@ -10,7 +10,7 @@ from typing import List, Optional, Tuple
 from cwa_book_downloader.core.logger import setup_logger
 from cwa_book_downloader.core.config import config
 from cwa_book_downloader.core.naming import parse_naming_template, sanitize_filename
-from cwa_book_downloader.core.utils import is_audiobook as check_audiobook
+from cwa_book_downloader.core.utils import is_audiobook as check_audiobook, split_csv
 from cwa_book_downloader.download.fs import atomic_write, atomic_move
 
 logger = setup_logger(__name__)
@@ -21,7 +21,7 @@ def _get_supported_formats() -> List[str]:
     formats = config.get("SUPPORTED_FORMATS", ["epub", "mobi", "azw3", "fb2", "djvu", "cbz", "cbr"])
     # Handle both list (from MultiSelectField) and comma-separated string (legacy/env)
     if isinstance(formats, str):
-        return [fmt.strip().lower() for fmt in formats.split(",") if fmt.strip()]
+        return [fmt.lower() for fmt in split_csv(formats)]
     return [fmt.lower() for fmt in formats]
 
 
@@ -30,7 +30,7 @@ def _get_supported_audiobook_formats() -> List[str]:
     formats = config.get("SUPPORTED_AUDIOBOOK_FORMATS", ["m4b", "mp3"])
     # Handle both list (from MultiSelectField) and comma-separated string (legacy/env)
     if isinstance(formats, str):
-        return [fmt.strip().lower() for fmt in formats.split(",") if fmt.strip()]
+        return [fmt.lower() for fmt in split_csv(formats)]
     return [fmt.lower() for fmt in formats]
 
 
@@ -132,20 +132,21 @@ class CorruptedArchiveError(ArchiveExtractionError):
     pass
 
 
+ARCHIVE_SUFFIXES = (".zip", ".rar")
+
+
 def is_archive(file_path: Path) -> bool:
     """Check if file is a supported archive format."""
-    suffix = file_path.suffix.lower().lstrip(".")
-    return suffix in ("zip", "rar")
+    return file_path.name.lower().endswith(ARCHIVE_SUFFIXES)
 
 
-def _is_supported_file(file_path: Path, content_type: Optional[str] = None) -> bool:
-    """Check if file matches user's supported formats setting based on content type."""
-    ext = file_path.suffix.lower().lstrip(".")
+def _get_supported_extensions(content_type: Optional[str] = None) -> frozenset:
+    """Get the user's supported extensions (with leading dot) for the content type."""
     if check_audiobook(content_type):
         supported_formats = _get_supported_audiobook_formats()
     else:
         supported_formats = _get_supported_formats()
-    return ext in supported_formats
+    return frozenset(f".{fmt}" for fmt in supported_formats)
 
 
 # All known ebook extensions (superset of what user might enable)
@@ -155,29 +156,6 @@ ALL_EBOOK_EXTENSIONS = {'.pdf', '.epub', '.mobi', '.azw', '.azw3', '.fb2', '.djv
 ALL_AUDIO_EXTENSIONS = {'.m4b', '.mp3', '.m4a', '.aac', '.flac', '.ogg', '.wma', '.wav', '.opus'}
 
 
-def _filter_files(
-    extracted_files: List[Path],
-    content_type: Optional[str] = None,
-) -> Tuple[List[Path], List[Path], List[Path]]:
-    """Filter files by content type. Returns (matched, rejected_format, other)."""
-    is_audiobook = check_audiobook(content_type)
-    known_extensions = ALL_AUDIO_EXTENSIONS if is_audiobook else ALL_EBOOK_EXTENSIONS
-
-    matched_files = []
-    rejected_format_files = []
-    other_files = []
-
-    for file_path in extracted_files:
-        if _is_supported_file(file_path, content_type):
-            matched_files.append(file_path)
-        elif file_path.suffix.lower() in known_extensions:
-            rejected_format_files.append(file_path)
-        else:
-            other_files.append(file_path)
-
-    return matched_files, rejected_format_files, other_files
-
-
 def extract_archive(
     archive_path: Path,
     output_dir: Path,
@@ -186,56 +164,57 @@ def extract_archive(
     """Extract archive and filter by content type. Returns (matched, warnings, rejected)."""
     suffix = archive_path.suffix.lower().lstrip(".")
 
+    # Only matching files are extracted; rejected/other entries are never written
     if suffix == "zip":
-        extracted_files, warnings = _extract_zip(archive_path, output_dir)
+        matched_files, rejected_files, other_files = _extract_zip(archive_path, output_dir, content_type)
     elif suffix == "rar":
-        extracted_files, warnings = _extract_rar(archive_path, output_dir)
+        matched_files, rejected_files, other_files = _extract_rar(archive_path, output_dir, content_type)
     else:
         raise ArchiveExtractionError(f"Unsupported archive format: {suffix}")
 
     is_audiobook = check_audiobook(content_type)
     file_type_label = "audiobook" if is_audiobook else "book"
-
-    # Filter files based on content type
-    matched_files, rejected_files, other_files = _filter_files(extracted_files, content_type)
-
-    # Delete rejected files (valid formats but not enabled by user)
-    for rejected_file in rejected_files:
-        try:
-            rejected_file.unlink()
-            logger.debug(f"Deleted rejected {file_type_label} file: {rejected_file.name}")
-        except OSError as e:
-            logger.warning(f"Failed to delete rejected {file_type_label} file {rejected_file}: {e}")
+    warnings = []
 
     if rejected_files:
         rejected_exts = sorted(set(f.suffix.lower() for f in rejected_files))
         warnings.append(f"Skipped {len(rejected_files)} {file_type_label}(s) with unsupported format: {', '.join(rejected_exts)}")
 
-    # Delete other files (images, html, etc)
-    for other_file in other_files:
-        try:
-            other_file.unlink()
-            logger.debug(f"Deleted non-{file_type_label} file: {other_file.name}")
-        except OSError as e:
-            logger.warning(f"Failed to delete non-{file_type_label} file {other_file}: {e}")
-
     if other_files:
         warnings.append(f"Skipped {len(other_files)} non-{file_type_label} file(s)")
 
     return matched_files, warnings, rejected_files
 
 
-def _extract_files_from_archive(archive, output_dir: Path) -> List[Path]:
-    """Extract files from ZipFile or RarFile to output_dir with security checks."""
+def _extract_files_from_archive(
+    archive,
+    output_dir: Path,
+    content_type: Optional[str] = None,
+) -> Tuple[List[Path], List[Path], List[Path]]:
+    """Extract matching files from ZipFile or RarFile to output_dir with security checks.
+
+    Entries are classified by name before decompression, in the same pass. Returns
+    (extracted, rejected_format, other), where rejected/other are the paths those
+    entries would have had - they are never written.
+    """
+    is_audiobook = check_audiobook(content_type)
+    known_extensions = ALL_AUDIO_EXTENSIONS if is_audiobook else ALL_EBOOK_EXTENSIONS
+    # Formats are live settings, so read them once per archive rather than per file
+    supported_extensions = _get_supported_extensions(content_type)
+
     extracted_files = []
+    rejected_format_files = []
+    other_files = []
+    resolved_output_dir = output_dir.resolve()
 
     for info in archive.infolist():
         if info.is_dir():
             continue
 
-        # Use only filename, strip directory path (security: prevent path traversal)
-        filename = Path(info.filename).name
-        if not filename:
+        # Use only filename, strip directory path (security: prevent path traversal).
+        # Archive member names always use '/' separators, so split the string directly.
+        filename = info.filename.rpartition("/")[2]
+        if filename in ("", ".", ".."):
             continue
 
         # Security: reject filenames with null bytes or path separators
@@ -247,37 +226,46 @@ def _extract_files_from_archive(archive, output_dir: Path) -> List[Path]:
         # Extract to output_dir with flat structure
         target_path = output_dir / filename
 
+        # Skip unwanted entries without decompressing them
+        ext = target_path.suffix.lower()
+        if ext not in supported_extensions:
+            if ext in known_extensions:
+                rejected_format_files.append(target_path)
+            else:
+                other_files.append(target_path)
+            continue
+
         # Security: verify resolved path stays within output directory (defense-in-depth)
         try:
-            target_path.resolve().relative_to(output_dir.resolve())
+            target_path.resolve().relative_to(resolved_output_dir)
         except ValueError:
             logger.warning(f"Path traversal attempt blocked: {info.filename!r}")
             continue
 
+        # Stream the member to disk so large files aren't held in memory
         with archive.open(info) as src:
-            data = src.read()
-        final_path = atomic_write(target_path, data)
+            final_path = atomic_write(target_path, src)
         extracted_files.append(final_path)
-        logger.debug(f"Extracted: {filename}")
+        logger.debug("Extracted: %s", target_path.name)
 
-    return extracted_files
+    return extracted_files, rejected_format_files, other_files
 
 
-def _extract_zip(archive_path: Path, output_dir: Path) -> Tuple[List[Path], List[str]]:
-    """Extract files from a ZIP archive."""
+def _extract_zip(
+    archive_path: Path,
+    output_dir: Path,
+    content_type: Optional[str] = None,
+) -> Tuple[List[Path], List[Path], List[Path]]:
+    """Extract matching files from a ZIP archive."""
     try:
         with zipfile.ZipFile(archive_path, "r") as zf:
             # Check for password protection
-            for info in zf.infolist():
-                if info.flag_bits & 0x1:  # Encrypted flag
-                    raise PasswordProtectedError("ZIP archive is password protected")
-
-            # Test archive integrity
-            bad_file = zf.testzip()
-            if bad_file:
-                raise CorruptedArchiveError(f"Corrupted file in archive: {bad_file}")
+            if any(info.flag_bits & 0x1 for info in zf.infolist()):  # Encrypted flag
+                raise PasswordProtectedError("ZIP archive is password protected")
 
-            return _extract_files_from_archive(zf, output_dir), []
+            # No upfront testzip(): it decompresses every member just to check CRCs.
+            # Extracted members are CRC-checked as they're read (BadZipFile below).
+            return _extract_files_from_archive(zf, output_dir, content_type)
 
     except zipfile.BadZipFile as e:
         raise CorruptedArchiveError(f"Invalid or corrupted ZIP: {e}")
@@ -285,8 +273,12 @@ def _extract_zip(archive_path: Path, output_dir: Path) -> Tuple[List[Path], List
         raise ArchiveExtractionError(f"Permission denied: {e}")
 
 
-def _extract_rar(archive_path: Path, output_dir: Path) -> Tuple[List[Path], List[str]]:
-    """Extract files from a RAR archive."""
+def _extract_rar(
+    archive_path: Path,
+    output_dir: Path,
+    content_type: Optional[str] = None,
+) -> Tuple[List[Path], List[Path], List[Path]]:
+    """Extract matching files from a RAR archive."""
     if not RAR_AVAILABLE:
         raise ArchiveExtractionError("RAR extraction not available - rarfile library not installed")
 
@@ -296,10 +288,8 @@ def _extract_rar(archive_path: Path, output_dir: Path) -> Tuple[List[Path], List
             if rf.needs_password():
                 raise PasswordProtectedError("RAR archive is password protected")
 
-            # Test archive integrity
-            rf.testrar()
-
-            return _extract_files_from_archive(rf, output_dir), []
+            # No upfront testrar(): extracted members are CRC-checked as they're read
+            return _extract_files_from_archive(rf, output_dir, content_type)
 
     except rarfile.BadRarFile as e:
         raise CorruptedArchiveError(f"Invalid or corrupted RAR: {e}")
@@ -309,7 +299,7 @@ def _extract_rar(archive_path: Path, output_dir: Path) -> Tuple[List[Path], List
         raise ArchiveExtractionError(f"Permission denied: {e}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ArchiveResult:
     """Result of archive processing."""
 
@@ -341,10 +331,6 @@ def process_archive(
         extracted_files, warnings, rejected_files = extract_archive(archive_path, extract_dir, content_type)
 
         if not extracted_files:
-            # Clean up and return error
-            shutil.rmtree(extract_dir, ignore_errors=True)
-            archive_path.unlink(missing_ok=True)
-
             if rejected_files:
                 # Found files but they weren't in supported formats
                 rejected_exts = sorted(set(f.suffix.lower() for f in rejected_files))
@@ -396,11 +382,7 @@ def process_archive(
             dest_path = ingest_dir / filename
             final_path = atomic_move(extracted_file, dest_path)
             final_paths.append(final_path)
-            logger.debug(f"Moved to ingest: {final_path.name}")
-
-        # Clean up temp extraction directory and archive
-        shutil.rmtree(extract_dir, ignore_errors=True)
-        archive_path.unlink(missing_ok=True)
+            logger.debug("Moved to ingest: %s", final_path.name)
 
         # Build success message with format info
         formats = [p.suffix.lstrip(".").upper() for p in final_paths]
@@ -417,8 +399,6 @@ def process_archive(
 
     except PasswordProtectedError:
         logger.error(f"Password-protected archive: {archive_path.name}")
-        shutil.rmtree(extract_dir, ignore_errors=True)
-        archive_path.unlink(missing_ok=True)
         return ArchiveResult(
             success=False,
             final_paths=[],
@@ -428,8 +408,6 @@ def process_archive(
 
     except CorruptedArchiveError as e:
         logger.error(f"Corrupted archive: {e}")
-        shutil.rmtree(extract_dir, ignore_errors=True)
-        archive_path.unlink(missing_ok=True)
         return ArchiveResult(
             success=False,
             final_paths=[],
@@ -439,11 +417,14 @@ def process_archive(
 
     except ArchiveExtractionError as e:
         logger.error(f"Archive extraction failed: {e}")
-        shutil.rmtree(extract_dir, ignore_errors=True)
-        archive_path.unlink(missing_ok=True)
         return ArchiveResult(
             success=False,
             final_paths=[],
             message="",
             error=f"Extraction failed: {e}",
         )
+
+    finally:
+        # Extraction is one-shot: the temp directory and archive are never reused
+        shutil.rmtree(extract_dir, ignore_errors=True)
+        archive_path.unlink(missing_ok=True)
@@ -8,13 +8,18 @@ import errno
 import os
 import shutil
 from pathlib import Path
+from typing import BinaryIO, Union
 
 from cwa_book_downloader.core.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-def atomic_write(dest_path: Path, data: bytes, max_attempts: int = 100) -> Path:
+# Chunk size for streamed writes - bounds memory for large archive members
+COPY_BUFFER_SIZE = 1 << 20
+
+
+def atomic_write(dest_path: Path, data: Union[bytes, BinaryIO], max_attempts: int = 100) -> Path:
     """Write data to a file with atomic collision detection.
 
     If the destination already exists, retries with counter suffix (_1, _2, etc.)
@@ -22,7 +27,7 @@ def atomic_write(dest_path: Path, data: bytes, max_attempts: int = 100) -> Path:
 
     Args:
         dest_path: Desired destination path
-        data: Bytes to write
+        data: Bytes to write, or a readable binary stream to copy in chunks
         max_attempts: Maximum collision retries before raising error
 
     Returns:
@@ -38,18 +43,26 @@ def atomic_write(dest_path: Path, data: bytes, max_attempts: int = 100) -> Path:
     for attempt in range(max_attempts):
         try_path = dest_path if attempt == 0 else parent / f"{base}_{attempt}{ext}"
         try:
-            # O_CREAT | O_EXCL fails atomically if file exists
-            fd = os.open(str(try_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-            try:
-                os.write(fd, data)
-            finally:
-                os.close(fd)
-            if attempt > 0:
-                logger.info(f"File collision resolved: {try_path.name}")
-            return try_path
+            # Mode 'x' (O_CREAT | O_EXCL) fails atomically if file exists
+            dst = open(try_path, "xb", buffering=COPY_BUFFER_SIZE)
         except FileExistsError:
             continue
 
+        try:
+            with dst:
+                if isinstance(data, bytes):
+                    dst.write(data)
+                else:
+                    shutil.copyfileobj(data, dst, COPY_BUFFER_SIZE)
+        except Exception:
+            # Don't leave a partial file behind (e.g. corrupt archive member)
+            try_path.unlink(missing_ok=True)
+            raise
+
+        if attempt > 0:
+            logger.info(f"File collision resolved: {try_path.name}")
+        return try_path
+
     raise RuntimeError(f"Could not write file after {max_attempts} attempts: {dest_path}")
 
 
@@ -77,6 +90,9 @@ def atomic_move(source_path: Path, dest_path: Path, max_attempts: int = 100) ->
     base = dest_path.stem
     ext = dest_path.suffix
     parent = dest_path.parent
+    # Set after the first EXDEV so collision retries don't re-attempt a rename
+    # that can never succeed
+    cross_device = False
 
     for attempt in range(max_attempts):
         try_path = dest_path if attempt == 0 else parent / f"{base}_{attempt}{ext}"
@@ -85,32 +101,35 @@ def atomic_move(source_path: Path, dest_path: Path, max_attempts: int = 100) ->
         if try_path.exists():
             continue
 
-        try:
-            # os.rename is atomic on same filesystem and triggers inotify events
-            os.rename(str(source_path), str(try_path))
-            if attempt > 0:
-                logger.info(f"File collision resolved: {try_path.name}")
-            return try_path
-        except FileExistsError:
-            # Race condition: file created between exists() check and rename()
-            continue
-        except OSError as e:
-            # Cross-filesystem - fall back to exclusive create + move
-            if e.errno != errno.EXDEV:
-                raise
+        if not cross_device:
             try:
-                fd = os.open(str(try_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-                os.close(fd)
-                try:
-                    shutil.move(str(source_path), str(try_path))
-                    if attempt > 0:
-                        logger.info(f"File collision resolved: {try_path.name}")
-                    return try_path
-                except Exception:
-                    try_path.unlink(missing_ok=True)
-                    raise
+                # os.rename is atomic on same filesystem and triggers inotify events
+                os.rename(str(source_path), str(try_path))
+                if attempt > 0:
+                    logger.info(f"File collision resolved: {try_path.name}")
+                return try_path
             except FileExistsError:
+                # Race condition: file created between exists() check and rename()
                 continue
+            except OSError as e:
+                # Cross-filesystem - fall back to exclusive create + move
+                if e.errno != errno.EXDEV:
+                    raise
+                cross_device = True
+
+        try:
+            fd = os.open(str(try_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+            try:
+                shutil.move(str(source_path), str(try_path))
+                if attempt > 0:
+                    logger.info(f"File collision resolved: {try_path.name}")
+                return try_path
+            except Exception:
+                try_path.unlink(missing_ok=True)
+                raise
+        except FileExistsError:
+            continue
 
     raise RuntimeError(f"Could not move file after {max_attempts} attempts: {dest_path}")
 
@@ -11,11 +11,17 @@ import ipaddress
 
 from cwa_book_downloader.core.logger import setup_logger
 from cwa_book_downloader.core.config import config as app_config
+from cwa_book_downloader.core.utils import split_csv
 from datetime import datetime, timedelta
 
 
 def get_proxies() -> dict:
-    """Get current proxy configuration from config singleton."""
+    """Get current proxy configuration from config singleton.
+
+    Returns a new dict on every call. requests merges environment proxies
+    into the ``proxies`` argument in place, so a shared or read-only mapping
+    would either leak those entries into later calls or fail outright.
+    """
     proxy_mode = app_config.get("PROXY_MODE", "none")
 
     if proxy_mode == "socks5":
@@ -790,7 +796,7 @@ def _get_initial_dns_config() -> tuple[str, List[str] | None, bool]:
     if provider == "manual":
         manual_dns = str(app_config.get("CUSTOM_DNS_MANUAL", "")).strip()
         if manual_dns:
-            manual_servers = [s.strip() for s in manual_dns.split(",") if s.strip()]
+            manual_servers = split_csv(manual_dns)
 
     # Handle legacy format: IPs directly in CUSTOM_DNS setting
     if provider and provider not in ("auto", "system", "google", "cloudflare", "quad9", "opendns", "manual", ""):
@@ -815,8 +821,10 @@ def _build_aa_urls() -> List[str]:
     urls = ["https://annas-archive.org", "https://annas-archive.se", "https://annas-archive.li"]
     additional = app_config.get("AA_ADDITIONAL_URLS", "")
     if additional:
-        urls.extend(u.strip() for u in additional.split(",") if u.strip())
-    return urls
+        urls.extend(split_csv(additional))
+    # Drop duplicates (e.g. an additional URL that repeats a default) so each
+    # mirror is only probed once, keeping the original order
+    return list(dict.fromkeys(urls))
 
 
 def _initialize_aa_state() -> None:
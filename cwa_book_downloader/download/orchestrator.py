@@ -23,6 +23,7 @@ from cwa_book_downloader.config.env import TMP_DIR
 from cwa_book_downloader.core.utils import get_ingest_dir, get_destination, get_aa_content_type_dir, is_audiobook as check_audiobook, transform_cover_url
 from cwa_book_downloader.core.naming import build_library_path, same_filesystem, assign_part_numbers, parse_naming_template, sanitize_filename
 from cwa_book_downloader.download.archive import (
+    ARCHIVE_SUFFIXES,
     is_archive,
     process_archive,
     _get_file_organization,
@@ -139,27 +140,56 @@ def _get_supported_formats(content_type: str = None) -> List[str]:
     return _get_book_formats()
 
 
-def _find_book_files_in_directory(directory: Path, content_type: str = None) -> Tuple[List[Path], List[Path]]:
-    """Find book files matching supported formats. Returns (matches, rejected)."""
+# Known book/audiobook extensions reported as rejected when not in the supported formats
+_TRACKABLE_AUDIOBOOK_EXTS = frozenset({'.m4b', '.mp3', '.m4a', '.flac', '.ogg', '.wma', '.aac', '.wav'})
+_TRACKABLE_BOOK_EXTS = frozenset({
+    '.pdf', '.epub', '.mobi', '.azw', '.azw3', '.fb2', '.djvu', '.cbz', '.cbr', '.doc', '.docx', '.rtf', '.txt',
+})
+
+
+def _find_book_files_in_directory(
+    directory: Path,
+    content_type: str = None,
+) -> Tuple[List[Path], List[Path], List[Path]]:
+    """Find book files matching supported formats. Returns (matches, rejected, archives)."""
     book_files = []
     rejected_files = []
+    archive_files = []
     supported_formats = _get_supported_formats(content_type)
     supported_exts = {f".{fmt}" for fmt in supported_formats}
 
-    is_audiobook = check_audiobook(content_type)
-    if is_audiobook:
-        trackable_exts = {'.m4b', '.mp3', '.m4a', '.flac', '.ogg', '.wma', '.aac', '.wav'}
-    else:
-        trackable_exts = {'.pdf', '.epub', '.mobi', '.azw', '.azw3', '.fb2', '.djvu', '.cbz', '.cbr', '.doc', '.docx', '.rtf', '.txt'}
+    trackable_exts = _TRACKABLE_AUDIOBOOK_EXTS if check_audiobook(content_type) else _TRACKABLE_BOOK_EXTS
 
-    for file_path in directory.rglob("*"):
-        if file_path.is_file():
-            if file_path.suffix.lower() in supported_exts:
-                book_files.append(file_path)
-            elif file_path.suffix.lower() in trackable_exts:
-                rejected_files.append(file_path)
-
-    return book_files, rejected_files
+    # Single scandir walk: DirEntry caches file types, so no extra stat() per entry.
+    # Symlinked directories aren't descended into, matching Path.rglob().
+    # Errors on the root propagate (an unreadable download isn't "no files");
+    # unreadable subdirectories are logged and skipped
+    root = str(directory)
+    pending = [root]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext in supported_exts:
+                        book_files.append(Path(entry.path))
+                    elif ext in trackable_exts:
+                        rejected_files.append(Path(entry.path))
+                    if ext in ARCHIVE_SUFFIXES:
+                        archive_files.append(Path(entry.path))
+        except OSError as e:
+            if current == root:
+                raise
+            logger.warning(f"Cannot scan {current}: {e}")
+
+    return book_files, rejected_files, archive_files
 
 
 def process_directory(
@@ -170,10 +200,8 @@ def process_directory(
     """Process staged directory: find book files, extract archives, move to ingest."""
     try:
         content_type = task.content_type
-        book_files, rejected_files = _find_book_files_in_directory(directory, content_type)
-
-        # Find archives in directory (ZIP/RAR)
-        archive_files = [f for f in directory.rglob("*") if f.is_file() and is_archive(f)]
+        # Book files, rejected formats and archives (ZIP/RAR) in one walk
+        book_files, rejected_files, archive_files = _find_book_files_in_directory(directory, content_type)
 
         if not book_files:
             # No direct book files - check for archives to extract
@@ -434,8 +462,8 @@ def queue_status() -> Dict[str, Dict[str, Any]]:
         for status_type, tasks in status.items()
     }
 
-def get_book_data(task_id: str) -> Tuple[Optional[bytes], Optional[DownloadTask]]:
-    """Get downloaded file data for a specific task."""
+def get_book_path(task_id: str) -> Tuple[Optional[Path], Optional[DownloadTask]]:
+    """Get the downloaded file path for a specific task (streamed by the caller, not read into memory)."""
     task = None
     try:
         task = book_queue.get_task(task_id)
@@ -446,8 +474,9 @@ def get_book_data(task_id: str) -> Tuple[Optional[bytes], Optional[DownloadTask]
         if not path:
             return None, task
 
-        with open(path, "rb") as f:
-            return f.read(), task
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Downloaded file no longer exists: {path}")
+        return Path(path), task
     except Exception as e:
         logger.error_trace(f"Error getting book data: {e}")
         if task:
@@ -632,7 +661,8 @@ def _is_torrent_source(source_path: Path, task: DownloadTask) -> bool:
     if not task.original_download_path:
         return False
     try:
-        return source_path.resolve() == Path(task.original_download_path).resolve()
+        # Compares device + inode: two stat() calls instead of resolving every path component
+        return os.path.samefile(source_path, task.original_download_path)
     except (OSError, ValueError):
         return False
 
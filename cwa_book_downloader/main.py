@@ -1,6 +1,5 @@
 """Flask app - routes, WebSocket handlers, and middleware."""
 
-import io
 import logging
 import os
 import sqlite3
@@ -577,15 +576,14 @@ def api_local_download() -> Union[Response, Tuple[Response, int]]:
         return jsonify({"error": "No book ID provided"}), 400
 
     try:
-        file_data, book_info = backend.get_book_data(book_id)
-        if file_data is None:
+        file_path, book_info = backend.get_book_path(book_id)
+        if file_path is None:
             # Book data not found or not available
             return jsonify({"error": "File not found"}), 404
         file_name = book_info.get_filename()
-        # Prepare the file for sending to the client
-        data = io.BytesIO(file_data)
+        # Stream from disk rather than buffering the whole file in memory
         return send_file(
-            data,
+            file_path,
             download_name=file_name,
             as_attachment=True
         )
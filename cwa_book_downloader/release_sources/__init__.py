@@ -309,8 +309,10 @@ def list_available_sources() -> List[dict]:
 
 def get_source_display_name(name: str) -> str:
     """Get display name for a source by its identifier."""
+    # display_name is a class attribute - read it without instantiating the source,
+    # since this runs for every task on every status broadcast
     if name in _SOURCES:
-        return _SOURCES[name]().display_name
+        return _SOURCES[name].display_name
     return name.replace('_', ' ').title()
 
 
@@ -13,7 +13,7 @@ from bs4 import BeautifulSoup, NavigableString, Tag
 
 from cwa_book_downloader.download import http as downloader
 from cwa_book_downloader.download import network
-from cwa_book_downloader.config.env import DEBUG_SKIP_SOURCES, TMP_DIR
+from cwa_book_downloader.config.env import DEBUG_SKIP_SOURCES
 from cwa_book_downloader.core.config import config
 from cwa_book_downloader.core.utils import CONTENT_TYPES
 from cwa_book_downloader.core.logger import setup_logger
@@ -1119,7 +1119,8 @@ class DirectDownloadHandler(DownloadHandler):
                 book_name = f"{book_info.id}.{book_info.format or 'bin'}"
             else:
                 book_name = book_info.get_filename()
-            book_path = TMP_DIR / book_name
+            from cwa_book_downloader.download.orchestrator import get_staging_dir
+            book_path = get_staging_dir() / book_name
 
             # Check cancellation before download
             if cancel_flag.is_set():
@@ -11,6 +11,7 @@ from typing import Optional
 
 from cwa_book_downloader.core.config import config
 from cwa_book_downloader.core.logger import setup_logger
+from cwa_book_downloader.core.utils import split_csv
 
 logger = setup_logger(__name__)
 
@@ -33,7 +34,7 @@ def _get_supported_formats() -> set[str]:
     """Get user's configured supported formats from settings."""
     formats = config.get("SUPPORTED_FORMATS", ["epub", "mobi", "azw3", "fb2", "djvu", "cbz", "cbr"])
     if isinstance(formats, str):
-        return {fmt.strip().lower() for fmt in formats.split(",") if fmt.strip()}
+        return {fmt.lower() for fmt in split_csv(formats)}
     return {fmt.lower() for fmt in formats}
 
 # Regex to parse result lines
@@ -416,8 +416,8 @@ class TestCrossFilesystem:
 
     def test_detect_cross_filesystem(self):
         """CROSS_FILE_SYSTEM detection should work."""
-        # This is a documentation test - the actual logic is in settings.py:
-        # CROSS_FILE_SYSTEM = os.stat(env.TMP_DIR).st_dev != os.stat(env.INGEST_DIR).st_dev
+        # This is a documentation test - the actual logic is in naming.py:
+        # same_filesystem() compares os.stat(...).st_dev for each transfer
         pass
 
 
@@ -129,6 +129,13 @@ class TestSupportedFormats:
         assert len(formats) > 0
         assert "epub" in formats
 
+    def test_comma_separated_formats_are_trimmed(self):
+        """Comma-separated format strings should ignore whitespace and empty items."""
+        from cwa_book_downloader.core.utils import split_csv
+
+        assert split_csv(" epub, mobi ,,azw3 , ") == ["epub", "mobi", "azw3"]
+        assert split_csv("") == []
+
 
 # =============================================================================
 # Content-Type Routing Tests
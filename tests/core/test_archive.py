@@ -0,0 +1,72 @@
+"""
+Tests for archive extraction.
+"""
+
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from cwa_book_downloader.download.archive import CorruptedArchiveError, extract_archive
+
+
+def _make_zip(path, members):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+class TestExtractArchive:
+    """Tests for extract_archive filtering and extraction."""
+
+    def test_only_supported_files_written(self, tmp_path):
+        archive = _make_zip(tmp_path / "pack.zip", {
+            "Book/book.epub": b"epub",
+            "Book/book.pdf": b"pdf",
+            "Book/cover.jpg": b"jpg",
+        })
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+
+        with patch("cwa_book_downloader.download.archive._get_supported_formats", return_value=["epub"]):
+            matched, warnings, rejected = extract_archive(archive, output_dir)
+
+        assert matched == [output_dir / "book.epub"]
+        assert [p.name for p in rejected] == ["book.pdf"]
+        assert sorted(p.name for p in output_dir.iterdir()) == ["book.epub"]
+        assert warnings == [
+            "Skipped 1 book(s) with unsupported format: .pdf",
+            "Skipped 1 non-book file(s)",
+        ]
+
+    def test_duplicate_names_flattened_without_overwrite(self, tmp_path):
+        archive = _make_zip(tmp_path / "pack.zip", {
+            "a/book.epub": b"first",
+            "b/book.epub": b"second",
+        })
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+
+        with patch("cwa_book_downloader.download.archive._get_supported_formats", return_value=["epub"]):
+            matched, _, _ = extract_archive(archive, output_dir)
+
+        assert sorted(p.read_bytes() for p in matched) == [b"first", b"second"]
+
+    def test_crc_mismatch_raises_and_leaves_no_partial_file(self, tmp_path):
+        archive = tmp_path / "pack.zip"
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr("book.epub", b"A" * 1000)
+        # Flip a byte of the stored member so only the CRC check can catch it
+        data = bytearray(archive.read_bytes())
+        data[data.find(b"A" * 1000) + 500] = ord("B")
+        archive.write_bytes(data)
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+
+        with patch("cwa_book_downloader.download.archive._get_supported_formats", return_value=["epub"]):
+            with pytest.raises(CorruptedArchiveError):
+                extract_archive(archive, output_dir)
+
+        assert list(output_dir.iterdir()) == []
+
@@ -0,0 +1,103 @@
+"""
+Tests for the in-memory metadata cache.
+"""
+
+from cwa_book_downloader.core.cache import CacheService, cache_key, cacheable
+
+
+class TestCacheService:
+    """Tests for CacheService get/set/eviction behaviour."""
+
+    def test_set_and_get(self):
+        cache = CacheService(max_size=10)
+        cache.set("key", {"title": "Test"}, ttl=60)
+
+        assert cache.get("key") == {"title": "Test"}
+
+    def test_get_missing_returns_none(self):
+        cache = CacheService(max_size=10)
+
+        assert cache.get("missing") is None
+
+    def test_expired_entry_returns_none(self):
+        cache = CacheService(max_size=10)
+        cache.set("key", "value", ttl=-1)
+
+        assert cache.get("key") is None
+        assert cache.stats()["size"] == 0
+
+    def test_eviction_removes_soonest_expiring_entries(self):
+        cache = CacheService(max_size=10)
+        for i in range(10):
+            cache.set(f"key{i}", i, ttl=100 + i)
+
+        # At capacity - next set evicts ~10% (one entry), soonest expiry first
+        cache.set("new", "value", ttl=1000)
+
+        assert cache.get("key0") is None
+        assert cache.get("key1") == 1
+        assert cache.get("new") == "value"
+        assert cache.stats()["size"] == 10
+
+    def test_eviction_sweeps_all_expired_entries(self):
+        cache = CacheService(max_size=10)
+        for i in range(5):
+            cache.set(f"stale{i}", i, ttl=-1)
+        for i in range(5):
+            cache.set(f"fresh{i}", i, ttl=100)
+
+        cache.set("new", "value", ttl=100)
+
+        assert cache.stats()["size"] == 6
+        assert all(cache.get(f"fresh{i}") == i for i in range(5))
+
+
+class TestCacheKey:
+    """Tests for cache key generation."""
+
+    def test_kwargs_order_does_not_matter(self):
+        assert cache_key("prefix", 1, a=1, b=2) == cache_key("prefix", 1, b=2, a=1)
+
+    def test_argument_types_distinguished(self):
+        assert cache_key("prefix", 1) != cache_key("prefix", "1")
+
+    def test_equal_values_of_different_types_distinguished(self):
+        keys = {cache_key("prefix", 1), cache_key("prefix", 1.0), cache_key("prefix", True)}
+
+        assert len(keys) == 3
+
+    def test_unhashable_arguments_supported(self):
+        key = cache_key("prefix", {"field": "value"})
+
+        assert hash(key) == hash(cache_key("prefix", {"field": "value"}))
+
+
+class TestCacheable:
+    """Tests for the cacheable decorator."""
+
+    def test_method_results_cached_without_self_in_key(self):
+        calls = []
+
+        class Provider:
+            @cacheable(ttl=60, key_prefix="test:method")
+            def lookup(self, query):
+                calls.append(query)
+                return {"query": query}
+
+        assert Provider().lookup("dune") == {"query": "dune"}
+        assert Provider().lookup("dune") == {"query": "dune"}
+        assert calls == ["dune"]
+
+    def test_none_results_not_cached(self):
+        """Providers return None on errors too, so a failed lookup must be retried."""
+        calls = []
+
+        @cacheable(ttl=60, key_prefix="test:error")
+        def lookup(query):
+            calls.append(query)
+            return None if len(calls) == 1 else {"query": query}
+
+        assert lookup("flaky") is None
+        assert lookup("flaky") == {"query": "flaky"}
+        assert calls == ["flaky", "flaky"]
+
@@ -234,6 +234,21 @@ class TestProcessDirectory:
         # Source directory cleaned up
         assert not directory.exists()
 
+    def test_unreadable_root_reports_scan_error(self, temp_dirs, sample_task):
+        """A directory that can't be scanned is an error, not an empty download."""
+        from cwa_book_downloader.download.orchestrator import process_directory
+
+        directory = temp_dirs["staging"] / "missing"
+
+        final_paths, error = process_directory(
+            directory=directory,
+            ingest_dir=temp_dirs["ingest"],
+            task=sample_task,
+        )
+
+        assert final_paths == []
+        assert "No such file or directory" in error
+
     def test_multiple_book_files(self, temp_dirs, sample_task):
         """Handles multiple book files in directory."""
         from cwa_book_downloader.download.orchestrator import process_directory
@@ -235,6 +235,34 @@ class TestAtomicMove:
             assert not source.exists()
             assert result.read_text() == "content"
 
+    def test_cross_filesystem_rename_not_retried_on_collision(self, tmp_path):
+        """After EXDEV, collision retries skip straight to the copy fallback."""
+        from cwa_book_downloader.download.orchestrator import _atomic_move
+        import errno
+
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        dest = tmp_path / "dest.txt"
+
+        real_open = os.open
+        claimed = []
+
+        def racing_open(path, flags, *args):
+            # Another worker claims dest.txt between exists() and O_EXCL create
+            if not claimed:
+                claimed.append(path)
+                raise FileExistsError(path)
+            return real_open(path, flags, *args)
+
+        with patch("os.rename", side_effect=OSError(errno.EXDEV, "Invalid cross-device link")) as mock_rename, \
+             patch("os.open", side_effect=racing_open):
+            result = _atomic_move(source, dest)
+
+        # One direct rename attempt, plus the one shutil.move makes internally
+        assert mock_rename.call_count == 2
+        assert result == tmp_path / "dest_1.txt"
+        assert result.read_text() == "content"
+
 
 class TestHardlinkWithLibraryMode:
     """Tests for hardlinking in library mode context."""
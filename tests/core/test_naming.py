@@ -31,6 +31,11 @@ class TestNaturalSortAndAssignment:
             "CD1_Track2.mp3", "CD1_Track10.mp3", "CD2_Track1.mp3", "CD2_Track10.mp3"
         ]
 
+    def test_natural_sort_punctuation_before_numbers(self):
+        # Digits compare as padded text, so punctuation and spaces sort before them
+        assert sorted(["a1.mp3", "a-b.mp3"], key=natural_sort_key) == ["a-b.mp3", "a1.mp3"]
+        assert sorted(["x02.mp3", "x 2.mp3"], key=natural_sort_key) == ["x 2.mp3", "x02.mp3"]
+
     def test_assign_part_numbers_empty(self):
         assert assign_part_numbers([]) == []
 
@@ -193,6 +198,13 @@ class TestParseNamingTemplate:
         result = parse_naming_template("{Author}/{Title}", {})
         assert result == ""
 
+    def test_repeated_calls_match_regardless_of_key_order(self):
+        """Test cached results don't depend on metadata key order or None values."""
+        template = "{Author}/{Title}"
+        first = parse_naming_template(template, {"Author": "Author", "Title": "Book"})
+        second = parse_naming_template(template, {"title": "Book", "Year": None, "AUTHOR": "Author"})
+        assert first == second == "Author/Book"
+
     def test_complex_template(self):
         """Test complex template with multiple conditional tokens."""
         template = "{Author}/{Series/}{SeriesPosition - }{Title}{ - Subtitle} ({Year})"
@@ -259,6 +271,22 @@ class TestBuildLibraryPath:
                 extension="txt"
             )
 
+    def test_symlinked_subdirectory_escaping_library_rejected(self, tmp_path):
+        """A symlinked author folder pointing outside the library is rejected."""
+        library = tmp_path / "library"
+        outside = tmp_path / "outside"
+        library.mkdir()
+        outside.mkdir()
+        (library / "Sanderson").symlink_to(outside)
+
+        with pytest.raises(ValueError, match="traversal"):
+            build_library_path(
+                str(library),
+                "{Author}/{Title}",
+                {"Author": "Sanderson", "Title": "Book"},
+                extension="epub"
+            )
+
     def test_fallback_to_title(self):
         """Test fallback when template produces empty result."""
         path = build_library_path(